@@ -1,103 +1,310 @@
+import functools
+import weakref
+from collections import namedtuple
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 
+# Plot width the trend chart is downsampled for, see _m4_indices
+_TREND_CHART_WIDTH_PX = 800
+
+# Totals are summed in float64 but handed to plotly as float32, which halves
+# the serialized arrays; hover labels round them back to cents.
+_PLOT_DTYPE = np.float32
+_AMOUNT_FORMAT = ',.2f'
+
+# Aggregates and figures keyed on (function name, id(df), ...); entries are
+# dropped when a DataFrame they were computed from is garbage collected.
+_frame_cache = {}
+
+
+def _frame_fingerprint(df):
+    """
+    Cheap marker of a DataFrame's contents.
+
+    Rows added or removed change the shape; loaders that edit a frame in
+    place should bump df.attrs['version'] to invalidate cached results.
+    """
+    return df.shape, df.attrs.get('version', 0)
+
+
+def _cached_per_frame(func):
+    """
+    Memoize a function of one or more DataFrames on their identity.
+
+    A cached result is reused while every argument is the same live object
+    with an unchanged fingerprint (see _frame_fingerprint).
+    """
+
+    @functools.wraps(func)
+    def wrapper(*frames):
+        key = (func.__name__, ) + tuple(map(id, frames))
+        fingerprint = tuple(map(_frame_fingerprint, frames))
+        entry = _frame_cache.get(key)
+        if (entry is not None and entry[1] == fingerprint
+                and all(ref() is df for ref, df in zip(entry[0], frames))):
+            return entry[2]
+
+        result = func(*frames)
+        refs = tuple(
+            weakref.ref(df, lambda _: _frame_cache.pop(key, None))
+            for df in frames)
+        _frame_cache[key] = (refs, fingerprint, result)
+        return result
+
+    return wrapper
+
+
+# The transaction columns every chart reads, held as one contiguous array each
+_Transactions = namedtuple('_Transactions', ['amount', 'category'])
+
+
+@_cached_per_frame
+def _transaction_columns(transactions_df):
+    """
+    Extract amount and category from a transactions DataFrame.
+
+    Numpy- and Arrow-backed (dtype_backend='pyarrow') frames give the same
+    result: amounts as a contiguous float64 ndarray with NaN for missing
+    values, categories as a pandas Categorical.
+    """
+    amount = transactions_df['amount'].to_numpy(dtype='float64',
+                                                 na_value=np.nan)
+    return _Transactions(amount=np.ascontiguousarray(amount),
+                         category=pd.Categorical(transactions_df['category']))
+
+
+@_cached_per_frame
+def _expenses_by_category(transactions_df):
+    """Total spending per category as a positive-valued Series."""
+    amounts, categories = _transaction_columns(transactions_df)
+    codes = categories.codes
+    expenses = (amounts < 0) & (codes >= 0)
+    # Dense sum per category code, categories are few so no hashing needed
+    totals = np.bincount(codes[expenses],
+                         weights=-amounts[expenses],
+                         minlength=len(categories.categories))
+    # Categories that only ever appear with income have nothing to show
+    spent = totals > 0
+    return pd.Series(totals[spent],
+                     index=categories.categories[spent].rename('category'),
+                     name='amount')
+
+
+@_cached_per_frame
+def _transaction_months(transactions_df):
+    """
+    Month of every transaction as an integer key (months since 1970-01).
+
+    Transactions without a date get the NaT sentinel, see _has_month.
+    """
+    dates = transactions_df['date']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, cache=True)
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)  # Bucket on local wall time
+    dates = dates.to_numpy(dtype='datetime64[ns]',
+                           na_value=np.datetime64('NaT'))
+    return dates.astype('datetime64[M]').view('int64')
+
+
+def _has_month(months):
+    """Mask of the month keys that come from an actual date."""
+    return months != np.datetime64('NaT').view('int64')
+
+
+def _month_labels(months):
+    """Format integer month keys as 'YYYY-MM' axis labels."""
+    return np.datetime_as_string(
+        np.asarray(months, dtype='int64').astype('datetime64[M]'))
+
+
+def _sum_by_sorted_key(keys, values):
+    """
+    Sum values over runs of equal integer keys.
+
+    Transactions usually arrive in date order, so keys that are already
+    non-decreasing are reduced in one linear pass; otherwise they are
+    stably sorted first. Returns the unique keys (ascending) and their sums.
+    """
+    if keys.size and not np.all(keys[1:] >= keys[:-1]):
+        order = np.argsort(keys, kind='stable')
+        keys, values = keys[order], values[order]
+    if not keys.size:
+        return keys, values.astype('float64')
 
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return keys[starts], np.add.reduceat(values, starts)
+
+
+@_cached_per_frame
+def _monthly_expenses(transactions_df):
+    """Spending per (month, category) as a positive-valued Series."""
+    amounts, categories = _transaction_columns(transactions_df)
+    months = _transaction_months(transactions_df)
+    codes = categories.codes
+    expenses = (amounts < 0) & _has_month(months) & (codes >= 0)
+
+    # Fold (month, category code) into one sortable integer key
+    n_categories = max(len(categories.categories), 1)
+    keys, totals = _sum_by_sorted_key(
+        months[expenses] * n_categories + codes[expenses], -amounts[expenses])
+    months, codes = np.divmod(keys, n_categories)
+
+    index = pd.MultiIndex.from_arrays(
+        [months,
+         pd.Categorical.from_codes(codes, categories.categories)],
+        names=['month', 'category'])
+    return pd.Series(totals, index=index.remove_unused_levels(), name='amount')
+
+
+@_cached_per_frame
+def _monthly_income(transactions_df):
+    """Income per month."""
+    amounts = _transaction_columns(transactions_df).amount
+    months = _transaction_months(transactions_df)
+    income = (amounts > 0) & _has_month(months)
+    months, totals = _sum_by_sorted_key(months[income], amounts[income])
+    return pd.Series(totals,
+                     index=pd.Index(months, name='month'),
+                     name='amount')
+
+
+def _m4_indices(values, n_bins):
+    """
+    Positions kept when M4-downsampling a series to n_bins pixel columns.
+
+    Each bin keeps its first, last, minimum and maximum point, which draws
+    the same line as the full series at that width. Series that already
+    fit in 4 points per bin are kept whole.
+    """
+    n = len(values)
+    if n <= 4 * n_bins:
+        return np.arange(n)
+
+    bins = (np.arange(n) * n_bins) // n
+    firsts = np.flatnonzero(np.diff(bins, prepend=-1))
+    lasts = np.append(firsts[1:], n) - 1
+    # Within each bin (bins are sorted) order positions by value
+    by_value = np.lexsort((values, bins))
+    return np.unique(
+        np.concatenate([firsts, lasts, by_value[firsts], by_value[lasts]]))
+
+
+@_cached_per_frame
 def create_spending_pie_chart(transactions_df):
     """
     Create a pie chart showing spending by category.
     
+    Figures are cached per DataFrame (see _cached_per_frame), so repeated
+    calls with an unchanged frame return the same object; copy it with
+    go.Figure(fig) before modifying.
+    
     Args:
         transactions_df: Pandas DataFrame with transaction data
         
     Returns:
         plotly.graph_objects.Figure: Pie chart figure
     """
-    # Filter for expenses only (negative amounts)
-    expenses_df = transactions_df[transactions_df['amount'] < 0].copy()
-    expenses_df['amount'] = expenses_df['amount'].abs(
-    )  # Convert to positive for visualization
+    # Expenses (negative amounts) summed per category, as positive values
+    category_totals = _expenses_by_category(transactions_df)
+    labels = category_totals.index.to_numpy()
+    values = category_totals.to_numpy(dtype=_PLOT_DTYPE)
+    del category_totals
 
-    # Group by category and sum amounts
-    category_totals = expenses_df.groupby(
-        'category')['amount'].sum().reset_index()
-
-    # Create pie chart
-    fig = px.pie(category_totals,
-                 values='amount',
-                 names='category',
-                 title='Expenses by Category',
-                 hole=0.4,
-                 color_discrete_sequence=px.colors.qualitative.Plotly)
+    # Create pie chart, cycling through the palette like plotly express does
+    palette = px.colors.qualitative.Plotly
+    fig = go.Figure(
+        go.Pie(labels=labels,
+               values=values,
+               hole=0.4,
+               textposition='inside',
+               textinfo='percent+label',
+               hovertemplate='%{label}<br>%{value:' + _AMOUNT_FORMAT +
+               '}<br>%{percent}<extra></extra>',
+               marker=dict(colors=[
+                   palette[i % len(palette)] for i in range(len(labels))
+               ])))
 
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    fig.update_layout(legend=dict(
-        orientation="h", yanchor="bottom", y=-0.1, xanchor="center", x=0.5))
+    fig.update_layout(title='Expenses by Category',
+                      legend=dict(orientation="h",
+                                  yanchor="bottom",
+                                  y=-0.1,
+                                  xanchor="center",
+                                  x=0.5))
 
     return fig
 
 
+@_cached_per_frame
 def create_spending_trend_chart(transactions_df):
     """
     Create a line chart showing spending trends over time.
     
+    Figures are cached per DataFrame (see _cached_per_frame), so repeated
+    calls with an unchanged frame return the same object; copy it with
+    go.Figure(fig) before modifying.
+    
     Args:
         transactions_df: Pandas DataFrame with transaction data
         
     Returns:
         plotly.graph_objects.Figure: Line chart figure
     """
-    # Ensure date column is datetime
-    if 'date' in transactions_df.columns:
-        transactions_df['date'] = pd.to_datetime(transactions_df['date'])
-
-    # Group by month and category
-    transactions_df['month'] = transactions_df['date'].dt.to_period('M')
+    # Create monthly summary: one column of expenses per category
+    monthly_expenses = _monthly_expenses(transactions_df).unstack(
+        'category', fill_value=0)
+    monthly_income = _monthly_income(transactions_df)
 
-    # Separate income and expenses
-    income_df = transactions_df[transactions_df['amount'] > 0].copy()
-    expenses_df = transactions_df[transactions_df['amount'] < 0].copy()
-    expenses_df['amount'] = expenses_df['amount'].abs(
-    )  # Convert to positive for visualization
+    # Long histories are downsampled to what the chart can show; expenses
+    # are stacked, so all categories keep the months picked for their total
+    monthly_expenses = monthly_expenses.iloc[_m4_indices(
+        monthly_expenses.sum(axis=1).to_numpy(), _TREND_CHART_WIDTH_PX)]
+    monthly_income = monthly_income.iloc[_m4_indices(
+        monthly_income.to_numpy(), _TREND_CHART_WIDTH_PX)]
 
-    # Create monthly summary
-    monthly_expenses = expenses_df.groupby(['month', 'category'
-                                            ])['amount'].sum().reset_index()
-    monthly_income = income_df.groupby('month')['amount'].sum().reset_index()
-
-    # Convert period to string for plotting
-    monthly_expenses['month_str'] = monthly_expenses['month'].astype(str)
-    monthly_income['month_str'] = monthly_income['month'].astype(str)
+    income_months = _month_labels(monthly_income.index)
+    income = monthly_income.to_numpy(dtype=_PLOT_DTYPE)
+    months = _month_labels(monthly_expenses.index)
+    categories = monthly_expenses.columns
+    amounts = monthly_expenses.to_numpy()
+    stacked = amounts.cumsum(axis=1).astype(_PLOT_DTYPE)
+    amounts = amounts.astype(_PLOT_DTYPE)
+    del monthly_expenses, monthly_income
 
     # Create figure
     fig = go.Figure()
 
-    # Add income line
+    # Add income line (WebGL traces keep long histories responsive)
     fig.add_trace(
-        go.Scatter(x=monthly_income['month_str'],
-                   y=monthly_income['amount'],
-                   mode='lines+markers',
-                   name='Income',
-                   line=dict(color='green', width=3)))
-
-    # Add expense lines for each category
-    for category in monthly_expenses['category'].unique():
-        category_data = monthly_expenses[monthly_expenses['category'] ==
-                                         category]
-        fig.add_trace(
-            go.Scatter(
-                x=category_data['month_str'],
-                y=category_data['amount'],
-                mode='lines+markers',
-                name=category,
-                stackgroup='expenses'  # Stack the expenses
-            ))
+        go.Scattergl(x=income_months,
+                     y=income,
+                     mode='lines+markers',
+                     name='Income',
+                     line=dict(color='green', width=3)))
+
+    # Add stacked expense lines, one per category. Scattergl has no
+    # stackgroup, so each line is drawn at its running total and filled
+    # down to the previous one, while hovering shows its own amount.
+    fig.add_traces([
+        go.Scattergl(x=months,
+                     y=stacked[:, i],
+                     customdata=amounts[:, i],
+                     hovertemplate='%{customdata:' + _AMOUNT_FORMAT + '}',
+                     mode='lines+markers',
+                     name=category,
+                     fill='tozeroy' if i == 0 else 'tonexty')
+        for i, category in enumerate(categories)
+    ])
 
     # Update layout
     fig.update_layout(title='Monthly Income and Expenses Over Time',
                       xaxis_title='Month',
                       yaxis_title='Amount ($)',
+                      yaxis_hoverformat=_AMOUNT_FORMAT,
                       hovermode='x unified',
                       legend=dict(orientation="h",
                                   yanchor="bottom",
@@ -108,10 +315,15 @@ def create_spending_trend_chart(transactions_df):
     return fig
 
 
+@_cached_per_frame
 def create_budget_comparison_chart(transactions_df, budget_df):
     """
     Create a bar chart comparing actual spending to budgeted amounts.
     
+    Figures are cached per DataFrame (see _cached_per_frame), so repeated
+    calls with an unchanged frame return the same object; copy it with
+    go.Figure(fig) before modifying.
+    
     Args:
         transactions_df: Pandas DataFrame with transaction data
         budget_df: Pandas DataFrame with budget data
@@ -119,43 +331,33 @@ def create_budget_comparison_chart(transactions_df, budget_df):
     Returns:
         plotly.graph_objects.Figure: Bar chart figure
     """
-    # Filter for expenses only (negative amounts)
-    expenses_df = transactions_df[transactions_df['amount'] < 0].copy()
-    expenses_df['amount'] = expenses_df['amount'].abs(
-    )  # Convert to positive for visualization
-
-    # Group by category and sum amounts
-    actual_spending = expenses_df.groupby(
-        'category')['amount'].sum().reset_index()
-
-    # Merge with budget data
-    comparison_df = pd.merge(actual_spending,
-                             budget_df,
-                             on='category',
-                             how='outer').fillna(0)
-    comparison_df.columns = ['Category', 'Actual', 'Budgeted']
+    # Expenses (negative amounts) summed per category, as positive values
+    actual_spending = _expenses_by_category(transactions_df)
+    budgeted = budget_df.set_index('category').iloc[:, 0]
 
-    # Calculate difference
-    comparison_df[
-        'Difference'] = comparison_df['Budgeted'] - comparison_df['Actual']
-    comparison_df['Status'] = comparison_df['Difference'].apply(
-        lambda x: 'Under Budget' if x >= 0 else 'Over Budget')
+    # Align both on every category that has spending or a budget
+    categories = actual_spending.index.union(budgeted.index)
+    actual = actual_spending.reindex(categories, fill_value=0.0)
+    budget = budgeted.reindex(categories).fillna(0.0)
+    actual = actual.to_numpy(dtype=_PLOT_DTYPE)
+    budget = budget.to_numpy(dtype=_PLOT_DTYPE)
+    del actual_spending, budgeted
 
     # Create comparison chart
-    fig = px.bar(comparison_df,
-                 x='Category',
-                 y=['Actual', 'Budgeted'],
-                 barmode='group',
-                 title='Budget vs. Actual Spending',
-                 labels={
-                     'value': 'Amount ($)',
-                     'variable': ''
-                 },
-                 color_discrete_map={
-                     'Actual': '#636EFA',
-                     'Budgeted': '#00CC96'
-                 })
+    fig = go.Figure()
+    fig.add_traces([
+        go.Bar(name='Actual', x=categories, y=actual, marker_color='#636EFA'),
+        go.Bar(name='Budgeted',
+               x=categories,
+               y=budget,
+               marker_color='#00CC96')
+    ])
 
+    fig.update_layout(title='Budget vs. Actual Spending',
+                      barmode='group',
+                      xaxis_title='Category',
+                      yaxis_title='Amount ($)',
+                      yaxis_hoverformat=_AMOUNT_FORMAT)
     fig.update_layout(legend=dict(
         orientation="h", yanchor="bottom", y=-0.15, xanchor="center", x=0.5))
 
@@ -166,6 +368,9 @@ def create_savings_goal_progress(savings_goal, current_savings):
     """
     Create a gauge chart showing progress towards a savings goal.
     
+    Figures are cached on the amounts rounded to cents, so repeated calls
+    return the same object; copy it with go.Figure(fig) before modifying.
+
     Args:
         savings_goal: Target savings amount
         current_savings: Current savings amount
@@ -173,59 +378,70 @@ def create_savings_goal_progress(savings_goal, current_savings):
     Returns:
         plotly.graph_objects.Figure: Gauge chart figure
     """
-    percentage = min(100, (current_savings / savings_goal) *
-                     100) if savings_goal > 0 else 0
+    return _savings_goal_figure(round(float(savings_goal), 2),
+                                round(float(current_savings), 2))
 
-    fig = go.Figure(
-        go.Indicator(mode="gauge+number+delta",
-                     value=current_savings,
-                     domain={
-                         'x': [0, 1],
-                         'y': [0, 1]
-                     },
-                     title={'text': "Progress to Savings Goal"},
-                     delta={
-                         'reference': savings_goal,
-                         'increasing': {
-                             'color': "green"
-                         }
-                     },
-                     gauge={
-                         'axis': {
-                             'range': [0, savings_goal],
-                             'tickwidth': 1,
-                             'tickcolor': "darkblue"
-                         },
-                         'bar': {
-                             'color': "darkblue"
+
+@functools.lru_cache(maxsize=32)
+def _savings_goal_figure(savings_goal, current_savings):
+    """Build the (cached) savings goal gauge for rounded amounts."""
+    title = {'text': "Progress to Savings Goal"}
+    domain = {'x': [0, 1], 'y': [0, 1]}
+
+    if savings_goal <= 0:
+        # Without a goal there is no gauge range, only show the savings
+        fig = go.Figure(
+            go.Indicator(mode="number",
+                         value=current_savings,
+                         domain=domain,
+                         title=title))
+    else:
+        half = savings_goal * 0.5
+        three_quarters = savings_goal * 0.75
+        steps = [{
+            'range': [0, half],
+            'color': 'red'
+        }, {
+            'range': [half, three_quarters],
+            'color': 'yellow'
+        }, {
+            'range': [three_quarters, savings_goal],
+            'color': 'green'
+        }]
+
+        fig = go.Figure(
+            go.Indicator(mode="gauge+number+delta",
+                         value=current_savings,
+                         domain=domain,
+                         title=title,
+                         delta={
+                             'reference': savings_goal,
+                             'increasing': {
+                                 'color': "green"
+                             }
                          },
-                         'bgcolor':
-                         "white",
-                         'borderwidth':
-                         2,
-                         'bordercolor':
-                         "gray",
-                         'steps': [{
-                             'range': [0, savings_goal * 0.5],
-                             'color': 'red'
-                         }, {
-                             'range':
-                             [savings_goal * 0.5, savings_goal * 0.75],
-                             'color':
-                             'yellow'
-                         }, {
-                             'range': [savings_goal * 0.75, savings_goal],
-                             'color': 'green'
-                         }],
-                         'threshold': {
-                             'line': {
-                                 'color': "red",
-                                 'width': 4
+                         gauge={
+                             'axis': {
+                                 'range': [0, savings_goal],
+                                 'tickwidth': 1,
+                                 'tickcolor': "darkblue"
+                             },
+                             'bar': {
+                                 'color': "darkblue"
                              },
-                             'thickness': 0.75,
-                             'value': savings_goal
-                         }
-                     }))
+                             'bgcolor': "white",
+                             'borderwidth': 2,
+                             'bordercolor': "gray",
+                             'steps': steps,
+                             'threshold': {
+                                 'line': {
+                                     'color': "red",
+                                     'width': 4
+                                 },
+                                 'thickness': 0.75,
+                                 'value': savings_goal
+                             }
+                         }))
 
     fig.update_layout(
         height=300,